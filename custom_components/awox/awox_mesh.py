@@ -1,13 +1,13 @@
 """AwoX Mesh handler"""
 import logging
 import asyncio
-import async_timeout
-import queue
-import threading
+import heapq
 import time
 import re
+from functools import partial
 import homeassistant.util.dt as dt_util
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -19,6 +19,31 @@ from .scanner import DeviceScanner
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pre-computed thresholds so the update loop doesn't allocate timedeltas per device
+STALE_AFTER = timedelta(seconds=60)
+DISABLE_AFTER = timedelta(seconds=90)
+# Measured against time.monotonic() so NTP/DST clock jumps don't trigger (or delay) reconnects
+FORCE_RECONNECT_AFTER_SECONDS = 2 * 60 * 60
+
+# Trailing-edge debounce for rapid repeats of the same command (UI slider drags)
+COMMAND_DEBOUNCE = .08
+
+
+@dataclass(slots=True)
+class DeviceEntry:
+    """Per-device bookkeeping, slotted to keep hot-path access cheap."""
+    mac: str
+    mac_upper: str
+    name: str
+    callback: CALLBACK_TYPE
+    last_status: dict | None = None
+    last_update: datetime | None = None
+    # Freshness marker of the newest stale-heap entry, older entries are invalid
+    heap_key: datetime | None = None
+    update_count: int = 0
+    status_request_count: int = 0
+    rssi: int = -999999
+
 
 class AwoxMesh(DataUpdateCoordinator):
 
@@ -35,6 +60,7 @@ class AwoxMesh(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=30),
+            always_update=False,
         )
 
         self._mesh_name = mesh_name
@@ -43,6 +69,8 @@ class AwoxMesh(DataUpdateCoordinator):
 
         self._connected_bluetooth_device: AwoxMeshLight = None
         self._scanning_devices = False
+        self._last_connection_mono: float | None = None
+        self._last_good_mesh_id: int | None = None
 
         self._state = {
             'last_rssi_check': None,
@@ -50,26 +78,28 @@ class AwoxMesh(DataUpdateCoordinator):
             'connected_device': None,
         }
 
+        # Only read and mutated from the event loop: the command worker is a loop task,
+        # BLE status callbacks are marshalled onto the loop and entities register while
+        # being constructed during platform setup, so no locking needed
         self._devices = {}
-
-        self._queue = queue.Queue()
-        self._shutdown = False
-        self._command_tread = threading.Thread(target=self._process_command_queue,
-                                               name="AwoxMeshCommands-" + self._mesh_name)
-        self._command_tread.daemon = True
-        self._command_tread.start()
-
-        def startup(event):
+        self._connect_order: list[int] = []
+        self._inflight_status: set[int] = set()
+        self._stale_heap: list[tuple[datetime, int]] = []
+        self._pending_commands: dict[tuple[int, str], dict] = {}
+        self._debounce_handles: dict[tuple[int, str], asyncio.TimerHandle] = {}
+
+        self._loop = hass.loop
+        self._queue = asyncio.Queue()
+        self._shutdown = asyncio.Event()
+        self._worker_task = hass.loop.create_task(self._process_command_queue())
+
+        async def startup(event):
             _LOGGER.debug('startup')
-            asyncio.run_coroutine_threadsafe(
-                self.async_refresh(), hass.loop
-            ).result()
+            await self.async_refresh()
 
-        def shutdown(event):
+        async def shutdown(event):
             _LOGGER.debug('shutdown')
-            asyncio.run_coroutine_threadsafe(
-                self.async_shutdown(), hass.loop
-            ).result()
+            await self.async_shutdown()
 
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, startup)
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
@@ -87,18 +117,26 @@ class AwoxMesh(DataUpdateCoordinator):
         return self._state
 
     def register_device(self, mesh_id: int, mac: str, name: str, callback_func: CALLBACK_TYPE):
-        self._devices[mesh_id] = {
-            'mac': mac,
-            'name': name,
-            'callback': callback_func,
-            'last_update': None,
-            'update_count': 0,
-            'status_request_count': 0,
-            'rssi': -999999
-        }
+        # _devices is loop-thread-only, registering from another thread would race
+        # the command worker iterating the registry
+        assert self.hass.loop is asyncio.get_running_loop()
+
+        self._devices[mesh_id] = DeviceEntry(
+            mac=mac,
+            mac_upper=mac.upper() if mac is not None else None,
+            name=name,
+            callback=callback_func,
+        )
+        self._connect_order.append(mesh_id)
+        self._schedule_stale_check(mesh_id, dt_util.now())
 
         _LOGGER.info('[%s] Registered [%s] %d', self.mesh_name, mac, mesh_id)
 
+    def _schedule_stale_check(self, mesh_id: int, when: datetime):
+        """Mark when the device was last seen, lazily invalidating its older heap entries."""
+        self._devices[mesh_id].heap_key = when
+        heapq.heappush(self._stale_heap, (when, mesh_id))
+
     def is_connected(self) -> bool:
         return self._connected_bluetooth_device and self._connected_bluetooth_device.is_connected
 
@@ -107,27 +145,27 @@ class AwoxMesh(DataUpdateCoordinator):
 
     async def _async_update_data(self):
 
-        if not self._command_tread.is_alive():
-            raise UpdateFailed("Command tread died!")
+        if self._worker_task.done():
+            raise UpdateFailed("Command worker stopped!")
 
         # Reconnect bluetooth every 2 ours to prevent connection freeze
-        if self._state['last_connection'] is not None \
-                and self._state['last_connection'] < dt_util.now() - timedelta(hours=2):
+        if self._last_connection_mono is not None \
+                and time.monotonic() - self._last_connection_mono > FORCE_RECONNECT_AFTER_SECONDS:
             _LOGGER.info('async_update: Force disconnect to prevent connection freeze')
-            async with async_timeout.timeout(10):
+            async with asyncio.timeout(10):
                 await self._disconnect_current_device()
 
         if self._state['last_rssi_check'] is None:
             try:
-                async with async_timeout.timeout(120):
+                async with asyncio.timeout(120):
                     # Scan for devices and get try to determine there RSSI
                     await self._async_get_devices_rssi()
             except Exception as e:
                 _LOGGER.warning('[%s] Fetching RSSI failed - [%s] %s', self.mesh_name, type(e).__name__, e)
 
         try:
-            async with async_timeout.timeout(20):
-                await self._async_add_command_to_queue('requestStatus', {'dest': 0xffff, 'withResponse': True})
+            async with asyncio.timeout(20):
+                await self._async_request_status(0xffff)
         except Exception as e:
             _LOGGER.warning('[%s] Requesting status failed - [%s] %s', self.mesh_name, type(e).__name__, e)
 
@@ -139,43 +177,58 @@ class AwoxMesh(DataUpdateCoordinator):
 
             raise UpdateFailed('Reconnecting to BLE device' if self.is_reconnecting() else 'No device connected')
 
-        # Give mesh time to gather status updates
-        await asyncio.sleep(.5)
-
-        for mesh_id, device_info in self._devices.items():
+        # Give the mesh flood time to reach all devices, the broadcast above already
+        # targets everybody so a single (scaled) wait replaces per-device round-trips
+        await asyncio.sleep(min(.5 + .05 * len(self._devices), 3.0))
 
-            _LOGGER.debug(f'[{self.mesh_name}][{device_info["name"]}] update count: {device_info["update_count"]}; request count: {device_info["status_request_count"]}; RSSI: {device_info["rssi"]}; last update: {device_info["last_update"]}')
+        now = dt_util.now()
+        stale_at = now - STALE_AFTER
+        disable_at = now - DISABLE_AFTER
 
-            # Force status update for specific mesh_id when no new update for the last minute
-            if device_info['last_update'] is None \
-                    or device_info['last_update'] < dt_util.now() - timedelta(seconds=60):
-                _LOGGER.info('[%s][%s][%d] async_update: Requested status of', self.mesh_name, device_info['name'], mesh_id)
-
-                self._devices[mesh_id]['status_request_count'] += 1
-                async with async_timeout.timeout(20):
-                    await self._async_add_command_to_queue('requestStatus', {'dest': mesh_id, 'withResponse': True}, True)
-
-                # Give mesh time to gather status updates
-                await asyncio.sleep(.5)
+        # Only visit devices whose freshness marker crossed the stale threshold,
+        # entries superseded by a newer status update are skipped lazily
+        while self._stale_heap and self._stale_heap[0][0] < stale_at:
+            when, mesh_id = heapq.heappop(self._stale_heap)
+            device_info = self._devices.get(mesh_id)
+            if device_info is None or device_info.heap_key != when:
+                continue
 
-            # Disable devices we didn't get a response the last 90 seconds
-            if self._devices[mesh_id]['last_update'] is not None \
-                    and self._devices[mesh_id]['last_update'] < dt_util.now() - timedelta(seconds=90):
-                self._devices[mesh_id]['callback']({'state': None})
-                self._devices[mesh_id]['last_update'] = None
-                self._devices[mesh_id]['update_count'] = 0
-                # Device offline then we assume it's also out-of-range (device that's not always powered on for instance)
-                if self._devices[mesh_id]['rssi'] > -9999:
-                    self._devices[mesh_id]['rssi'] = -9999
+            _LOGGER.debug(f'[{self.mesh_name}][{device_info.name}] update count: {device_info.update_count}; request count: {device_info.status_request_count}; RSSI: {device_info.rssi}; last update: {device_info.last_update}')
 
-        return self._state
+            try:
+                # Force status update for specific mesh_id when the broadcast still left it without update the last minute
+                _LOGGER.info('[%s][%s][%d] async_update: Requested status of', self.mesh_name, device_info.name, mesh_id)
+
+                device_info.status_request_count += 1
+                async with asyncio.timeout(20):
+                    await self._async_request_status(mesh_id, True)
+
+                # Disable devices we didn't get a response the last 90 seconds
+                if device_info.last_update is not None \
+                        and device_info.last_update < disable_at:
+                    device_info.callback({'state': None})
+                    device_info.last_update = None
+                    device_info.update_count = 0
+                    # Device offline then we assume it's also out-of-range (device that's not always powered on for instance)
+                    if device_info.rssi > -9999:
+                        device_info.rssi = -9999
+            finally:
+                # Re-check on the very next cycle while the device stays silent, a key of
+                # `now` would only pop again once it aged past the stale threshold itself.
+                # We just popped the device's only valid heap entry, so re-push in a finally:
+                # a status request timeout must not orphan the device from stale tracking
+                self._schedule_stale_check(mesh_id, now - STALE_AFTER)
+
+        # Return a snapshot so the coordinator can skip listener updates when nothing changed,
+        # device level changes are already pushed through the per-device callbacks
+        return dict(self._state)
 
     def update_status_of_all_devices_to_disabled(self):
-        for mesh_id, device_info in self._devices.items():
-            if device_info['last_update'] is not None:
-                device_info['callback']({'state': None})
-                self._devices[mesh_id]['last_update'] = None
-                self._devices[mesh_id]['update_count'] = 0
+        for device_info in self._devices.values():
+            if device_info.last_update is not None:
+                device_info.callback({'state': None})
+                device_info.last_update = None
+                device_info.update_count = 0
 
     async def _async_update_mesh_state(self):
         if not self.is_connected() and not self.is_reconnecting():
@@ -184,43 +237,112 @@ class AwoxMesh(DataUpdateCoordinator):
         for update_callback, _ in list(self._listeners.values()):
             update_callback()
 
-    @callback
     def mesh_status_callback(self, status):
+        """Called by the BLE backend from its receiver thread, hand the status over to the loop."""
+        # In-flight packets keep arriving during teardown, don't bother entities that are being removed
+        if self._shutdown.is_set():
+            return
+
+        self._loop.call_soon_threadsafe(self._async_mesh_status_callback, status)
+
+    @callback
+    def _async_mesh_status_callback(self, status):
         if 'mesh_id' not in status or status['mesh_id'] not in self._devices:
             _LOGGER.info('[%s] Status feedback of unknown device - [%s]',
                          self.mesh_name, status['mesh_id'] if 'mesh_id' in status else 'unknown')
             return
 
+        device_info = self._devices[status['mesh_id']]
+
         _LOGGER.debug('[%s][%s][%d] mesh_status_callback(%s)',
-                      self.mesh_name, self._devices[status['mesh_id']]['name'], status['mesh_id'], status)
+                      self.mesh_name, device_info.name, status['mesh_id'], status)
 
         if status['type'] != 'status':
             _LOGGER.debug('[%s][%s][%d] skipping all non status callbacks',
-                      self.mesh_name, self._devices[status['mesh_id']]['name'], status['mesh_id'])
+                      self.mesh_name, device_info.name, status['mesh_id'])
             return
 
-        self._devices[status['mesh_id']]['callback'](status)
+        # The mesh floods packets so the same status arrives multiple times,
+        # only bother the entity when something actually changed
+        if status == device_info.last_status:
+            device_info.last_update = dt_util.now()
+            self._schedule_stale_check(status['mesh_id'], device_info.last_update)
+            return
+
+        device_info.last_status = dict(status)
+        device_info.callback(status)
+
+        device_info.last_update = dt_util.now()
+        device_info.update_count += 1
+        self._schedule_stale_check(status['mesh_id'], device_info.last_update)
 
-        self._devices[status['mesh_id']]['last_update'] = dt_util.now()
-        self._devices[status['mesh_id']]['update_count'] += 1
+    @callback
+    def _async_set_optimistic_status(self, mesh_id: int, status: dict):
+        """Push the expected device state to the entity so the UI updates right away,
+        the next (authoritative) status update of the mesh simply confirms or corrects it."""
+        if mesh_id not in self._devices:
+            return
+        device_info = self._devices[mesh_id]
+        # Drop the dedup cache so the first authoritative packet after the command always
+        # reaches the entity, it may match the pre-command status when the command failed
+        device_info.last_status = None
+        status['mesh_id'] = mesh_id
+        device_info.callback(status)
 
     async def async_on(self, mesh_id: int):
+        self._async_set_optimistic_status(mesh_id, {'state': True})
         await self._async_add_command_to_queue('on', {'dest': mesh_id})
 
     async def async_off(self, mesh_id: int, _attempt: int = 0):
+        self._async_set_optimistic_status(mesh_id, {'state': False})
         await self._async_add_command_to_queue('off', {'dest': mesh_id})
 
     async def async_set_color(self, mesh_id: int, r: int, g: int, b: int, _attempt: int = 0):
-        await self._async_add_command_to_queue('setColor', {'red': r, 'green': g, 'blue': b, 'dest': mesh_id})
+        self._async_set_optimistic_status(mesh_id, {'state': True, 'red': r, 'green': g, 'blue': b})
+        self._async_debounce_command(mesh_id, 'setColor', {'red': r, 'green': g, 'blue': b, 'dest': mesh_id})
 
     async def async_set_color_brightness(self, mesh_id: int, brightness: int, _attempt: int = 0):
-        await self._async_add_command_to_queue('setColorBrightness', {'brightness': brightness, 'dest': mesh_id})
+        self._async_set_optimistic_status(mesh_id, {'state': True, 'color_brightness': brightness})
+        self._async_debounce_command(mesh_id, 'setColorBrightness', {'brightness': brightness, 'dest': mesh_id})
 
     async def async_set_white_temperature(self, mesh_id: int, white_temperature: int, _attempt: int = 0):
-        await self._async_add_command_to_queue('setWhiteTemperature', {'temp': white_temperature, 'dest': mesh_id})
+        self._async_set_optimistic_status(mesh_id, {'state': True, 'white_temperature': white_temperature})
+        self._async_debounce_command(mesh_id, 'setWhiteTemperature', {'temp': white_temperature, 'dest': mesh_id})
 
     async def async_set_white_brightness(self, mesh_id: int, brightness: int, _attempt: int = 0):
-        await self._async_add_command_to_queue('setWhiteBrightness', {'brightness': brightness, 'dest': mesh_id})
+        self._async_set_optimistic_status(mesh_id, {'state': True, 'white_brightness': brightness})
+        self._async_debounce_command(mesh_id, 'setWhiteBrightness', {'brightness': brightness, 'dest': mesh_id})
+
+    @callback
+    def _async_debounce_command(self, mesh_id: int, command: str, params: dict):
+        """Keep only the most recent params for rapid repeats of the same command
+        (slider drags queue dozens of intermediate values) and flush once the burst settles."""
+        key = (mesh_id, command)
+        self._pending_commands[key] = params
+        handle = self._debounce_handles.pop(key, None)
+        if handle:
+            handle.cancel()
+        self._debounce_handles[key] = self._loop.call_later(COMMAND_DEBOUNCE, self._async_flush_command, key)
+
+    @callback
+    def _async_flush_command(self, key: tuple[int, str]):
+        self._debounce_handles.pop(key, None)
+        params = self._pending_commands.pop(key, None)
+        if params is None:
+            return
+        self.hass.async_create_task(self._async_add_command_to_queue(key[1], params))
+
+    async def _async_request_status(self, mesh_id: int, allow_to_fail: bool = False):
+        """Queue a requestStatus for the given mesh_id (0xffff broadcasts to the whole mesh),
+        skipping when a request for the same destination is already in flight."""
+        if mesh_id in self._inflight_status:
+            _LOGGER.debug('[%s][%d] Status request already in flight, skipping', self.mesh_name, mesh_id)
+            return
+        self._inflight_status.add(mesh_id)
+        try:
+            await self._async_add_command_to_queue('requestStatus', {'dest': mesh_id, 'withResponse': True}, allow_to_fail)
+        finally:
+            self._inflight_status.discard(mesh_id)
 
     async def _disconnect_current_device(self):
         if not self._connected_bluetooth_device:
@@ -228,7 +350,7 @@ class AwoxMesh(DataUpdateCoordinator):
         try:
             device = self._connected_bluetooth_device
             self._connected_bluetooth_device = None
-            async with async_timeout.timeout(10):
+            async with asyncio.timeout(10):
                 await self.hass.async_add_executor_job(device.disconnect)
         except Exception as e:
             _LOGGER.exception('[%s] Failed to disconnect [%s] %s', self.mesh_name, type(e).__name__, e)
@@ -237,65 +359,69 @@ class AwoxMesh(DataUpdateCoordinator):
 
     async def async_shutdown(self):
         _LOGGER.info('[%s] Shutdown mesh', self.mesh_name)
-        self._shutdown = True
+        self._shutdown.set()
+        self._worker_task.cancel()
+        for handle in self._debounce_handles.values():
+            handle.cancel()
+        self._debounce_handles.clear()
+        self._pending_commands.clear()
         return await self._disconnect_current_device()
 
-    async def _async_add_command_to_queue(self, command: str, params, allow_to_fail: bool = False):
+    async def _async_add_command_to_queue(self, command: str, params: dict, allow_to_fail: bool = False):
         _LOGGER.info('[%s] Queue command %s %s', self.mesh_name, command, params)
 
-        if not self._command_tread.is_alive():
-            raise UpdateFailed("Command tread died!")
+        if self._worker_task.done():
+            raise UpdateFailed("Command worker stopped!")
 
-        done = False
+        executed = self._loop.create_future()
 
         def command_executed():
-            nonlocal done
-            done = True
+            if not executed.done():
+                executed.set_result(True)
 
-        self._queue.put({
+        await self._queue.put({
             'command': command,
             'params': params,
             'callback': command_executed,
             'allow_to_fail': allow_to_fail
         })
-        while not done:
-            await asyncio.sleep(.01)
+        await executed
 
-    def _process_command_queue(self):
-        while not self._shutdown:
+    async def _process_command_queue(self):
+        while not self._shutdown.is_set():
 
             _LOGGER.debug('[%s] get item from queue', self.mesh_name)
-            command = self._queue.get()
+            command = await self._queue.get()
             _LOGGER.debug('[%s] process 0/%d - %s', self.mesh_name, self._queue.qsize(), command)
             try:
                 tries = 0
-                while not self._call_command(command) and tries < 3:
+                while not await self._call_command(command) and tries < 3:
                     tries = tries + 1
                     _LOGGER.warning('[%s] Command failed, retry %s', self.mesh_name, tries)
 
             except Exception as e:
                 _LOGGER.error('[%s] Command failed and skipped - [%s] %s', self.mesh_name, type(e).__name__, e)
-                asyncio.run_coroutine_threadsafe(
-                    self._disconnect_current_device(), self.hass.loop
-                ).result()
+                await self._disconnect_current_device()
 
             if 'callback' in command:
                 command['callback']()
 
             self._queue.task_done()
 
-    def _call_command(self, command) -> bool:
-        self._connect_device()
+    async def _call_command(self, command) -> bool:
+        await self._async_connect_device()
         if not self.is_connected():
             return False
 
         failed = False
         try:
-            # Call command
-            if isinstance(command['params'], tuple):
-                result = getattr(self._connected_bluetooth_device, command['command'])(*command['params'])
+            # Call command (params is always a mapping of keyword arguments),
+            # blocking light commands go through the shared executor pool
+            func = getattr(self._connected_bluetooth_device, command['command'])
+            if asyncio.iscoroutinefunction(func):
+                result = await func(**command['params'])
             else:
-                result = getattr(self._connected_bluetooth_device, command['command'])(**command['params'])
+                result = await self.hass.async_add_executor_job(partial(func, **command['params']))
             _LOGGER.debug(f'[{self.mesh_name}] Send command {command["command"]} got result {result}')
         except Exception as e:
             _LOGGER.exception('[%s] Command failed, re-connecting for new attempt - [%s] %s', self.mesh_name, type(e).__name__, e)
@@ -310,9 +436,7 @@ class AwoxMesh(DataUpdateCoordinator):
             failed = True
 
         if failed:
-            asyncio.run_coroutine_threadsafe(
-                self._disconnect_current_device(), self.hass.loop
-            ).result()
+            await self._disconnect_current_device()
 
         # Only report failure for commands that we do not allow to fail (status updates are for example commands we allow to fail)
         if failed and not command['allow_to_fail']:
@@ -320,11 +444,6 @@ class AwoxMesh(DataUpdateCoordinator):
 
         return True
 
-    def _connect_device(self):
-        asyncio.run_coroutine_threadsafe(
-            self._async_connect_device(), self.hass.loop
-        ).result()
-
     async def _async_connect_device(self):
 
         while self.is_reconnecting():
@@ -334,27 +453,29 @@ class AwoxMesh(DataUpdateCoordinator):
             return
 
         for mesh_id, device_info in self._getConnectableDevices():
-            if device_info['mac'] is None:
+            if device_info.mac is None:
                 continue
 
-            device = AwoxMeshLight(device_info['mac'], self._mesh_name, self._mesh_password, mesh_id)
+            device = AwoxMeshLight(device_info.mac, self._mesh_name, self._mesh_password, mesh_id)
             try:
-                _LOGGER.info("[%s][%s][%s] Trying to connect", self.mesh_name, device_info['name'], device.mac)
-                async with async_timeout.timeout(20):
+                _LOGGER.info("[%s][%s][%s] Trying to connect", self.mesh_name, device_info.name, device.mac)
+                async with asyncio.timeout(20):
                     if await self.hass.async_add_executor_job(device.connect):
                         self._connected_bluetooth_device = device
-                        self._state['connected_device'] = device_info['name']
+                        self._state['connected_device'] = device_info.name
                         self._state['last_connection'] = dt_util.now()
+                        self._last_connection_mono = time.monotonic()
+                        self._last_good_mesh_id = mesh_id
                         await self._async_update_mesh_state()
-                        _LOGGER.info("[%s][%s][%s] Connected", self.mesh_name, device_info['name'], device.mac)
+                        _LOGGER.info("[%s][%s][%s] Connected", self.mesh_name, device_info.name, device.mac)
                         break
                     else:
-                        _LOGGER.info("[%s][%s][%s] Could not connect", self.mesh_name, device_info['name'], device.mac)
+                        _LOGGER.info("[%s][%s][%s] Could not connect", self.mesh_name, device_info.name, device.mac)
             except Exception as e:
                 _LOGGER.info('[%s][%s][%s] Failed to connect, trying next device [%s] %s',
-                                  self.mesh_name, device_info['name'], device.mac, type(e).__name__, e)
+                                  self.mesh_name, device_info.name, device.mac, type(e).__name__, e)
 
-            _LOGGER.debug('[%s][%s][%s] Setting up Bluetooth connection failed, making sure Bluetooth device stops trying', self.mesh_name, device_info['name'], device.mac)
+            _LOGGER.debug('[%s][%s][%s] Setting up Bluetooth connection failed, making sure Bluetooth device stops trying', self.mesh_name, device_info.name, device.mac)
 
             await self.hass.async_add_executor_job(device.stop)
 
@@ -366,8 +487,16 @@ class AwoxMesh(DataUpdateCoordinator):
             await self._async_update_mesh_state()
 
     def _getConnectableDevices(self):
-        # Sort devices by rssi and only return devices with a RSSI that could be in range
-        return filter(lambda device: device[1]['rssi'] > -9999, sorted(self._devices.items(), key=lambda t: t[1]['rssi'], reverse=True))
+        # Try the previously successful device first, after a hiccup it's by far the most
+        # likely to accept a new connection, then walk the RSSI sorted connect order and
+        # only return devices with a RSSI that could be in range
+        order = self._connect_order
+        if self._last_good_mesh_id in self._devices:
+            order = [self._last_good_mesh_id] + [m for m in self._connect_order if m != self._last_good_mesh_id]
+        for mesh_id in order:
+            device_info = self._devices[mesh_id]
+            if device_info.rssi > -9999:
+                yield mesh_id, device_info
 
     async def _async_get_devices_rssi(self):
 
@@ -383,19 +512,23 @@ class AwoxMesh(DataUpdateCoordinator):
 
         _LOGGER.debug(f'[{self.mesh_name}] Scan result: {devices}')
 
-        for mesh_id, device_info in self._devices.items():
-            if device_info['mac'].upper() in devices and devices[device_info['mac'].upper()]['rssi'] is not None:
-                _LOGGER.info('[%s][%s][%s] Bluetooth scan returns RSSI value = %s', self.mesh_name, device_info['name'],
-                             device_info['mac'], devices[device_info['mac'].upper()]['rssi'])
-                self._devices[mesh_id]['rssi'] = devices[device_info['mac'].upper()]['rssi']
+        for device_info in self._devices.values():
+            scan_result = devices.get(device_info.mac_upper)
+            if scan_result is not None and scan_result['rssi'] is not None:
+                _LOGGER.info('[%s][%s][%s] Bluetooth scan returns RSSI value = %s', self.mesh_name, device_info.name,
+                             device_info.mac, scan_result['rssi'])
+                device_info.rssi = scan_result['rssi']
 
-            elif device_info['mac'].upper() in devices:
-                _LOGGER.info('[%s][%s][%s] Bluetooth scan returns no RSSI value', self.mesh_name, device_info['name'], device_info['mac'])
-                self._devices[mesh_id]['rssi'] = -99999
+            elif scan_result is not None:
+                _LOGGER.info('[%s][%s][%s] Bluetooth scan returns no RSSI value', self.mesh_name, device_info.name, device_info.mac)
+                device_info.rssi = -99999
 
             else:
-                _LOGGER.info('[%s][%s][%s] Device NOT found during Bluetooth scan', self.mesh_name, device_info['name'], device_info['mac'])
-                self._devices[mesh_id]['rssi'] = -999999
+                _LOGGER.info('[%s][%s][%s] Device NOT found during Bluetooth scan', self.mesh_name, device_info.name, device_info.mac)
+                device_info.rssi = -999999
+
+        # Re-sort the connect order by the fresh RSSI values, best candidate first
+        self._connect_order = sorted(self._devices, key=lambda k: self._devices[k].rssi, reverse=True)
 
         self._state['last_rssi_check'] = dt_util.now()
         await self._async_update_mesh_state()
@@ -1,6 +1,5 @@
 """Awox device scanner class"""
 import asyncio
-import async_timeout
 import logging
 
 from homeassistant.core import HomeAssistant
@@ -49,7 +48,7 @@ class DeviceScanner:
 
             await hass.async_add_executor_job(bl.stop_scan)
 
-            async with async_timeout.timeout(10):
+            async with asyncio.timeout(10):
                 await hass.async_add_executor_job(bl.shutdown)
 
         except Exception as e: